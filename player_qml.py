@@ -4,48 +4,395 @@ from pathlib import Path
 from PySide6 import QtCore, QtWidgets
 from PySide6 import QtGui
 from PySide6.QtCore import QUrl, Slot
+import functools
+import hashlib
 import json
+import queue
 import shutil
+import sqlite3
+import stat
 import subprocess
 import tempfile
 import threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from PySide6.QtQuickWidgets import QQuickWidget
 # On Windows, allow explicit libvlc location via env var or common install paths
+def _find_libvlc_dir():
+    # first candidate that actually holds libvlc.dll: a single stat per candidate
+    for p in (os.environ.get('PY_VIDEO_LIBVLC'),
+              r"C:\Program Files\VideoLAN\VLC", r"C:\Program Files (x86)\VideoLAN\VLC"):
+        if p and os.path.isfile(os.path.join(p, 'libvlc.dll')):
+            return p
+    return None
+
+
 if sys.platform.startswith('win'):
-    _env_path = os.environ.get('PY_VIDEO_LIBVLC')
-    if _env_path and os.path.exists(_env_path):
+    _libvlc_dir = _find_libvlc_dir()
+    if _libvlc_dir:
         try:
-            os.add_dll_directory(_env_path)
-        except Exception:
-            os.environ['PATH'] = _env_path + os.pathsep + os.environ.get('PATH', '')
-    else:
-        _possible_vlc_paths = [r"C:\Program Files\VideoLAN\VLC", r"C:\Program Files (x86)\VideoLAN\VLC"]
-        for _p in _possible_vlc_paths:
-            try:
-                if os.path.exists(_p) and os.path.exists(os.path.join(_p, 'libvlc.dll')):
-                    try:
-                        os.add_dll_directory(_p)
-                    except Exception:
-                        os.environ['PATH'] = _p + os.pathsep + os.environ.get('PATH', '')
-                    break
-            except Exception:
-                continue
+            os.add_dll_directory(_libvlc_dir)
+        except (AttributeError, OSError):
+            # PATH is only touched when the DLL directory API is missing (Python
+            # before 3.8) or rejects the directory
+            os.environ['PATH'] = _libvlc_dir + os.pathsep + os.environ.get('PATH', '')
 
 try:
     import vlc
 except Exception as e:
     raise RuntimeError("python-vlc import failed: %s" % e)
 
+# Hardware decoder per platform; libavcodec falls back to software decoding on
+# its own when the selected API is unavailable. PY_VIDEO_HWDEC overrides the
+# choice (e.g. "none" to force CPU decoding, "any" to let libVLC probe).
+if sys.platform.startswith('win'):
+    _DEFAULT_HWDEC = 'd3d11va'
+elif sys.platform.startswith('darwin'):
+    _DEFAULT_HWDEC = 'videotoolbox'
+else:
+    _DEFAULT_HWDEC = 'vaapi'
+
+# Video output: left to libVLC's own probe, which already ranks direct3d11 first
+# on Windows (so d3d11va frames are shown without a copy) and still falls back
+# where it cannot start (RDP, some VMs, broken drivers). A bare --vout would
+# disable that fallback and leave a black video widget, so PY_VIDEO_VOUT is an
+# explicit opt-in (e.g. "direct3d11,any" to keep a fallback).
+_DEFAULT_VOUT = ''
+
+# PY_VIDEO_DEBUG_STATUS=1 traces every status push; off, update_status does no
+# formatting or console I/O for it (and skips the state reads it needs)
+_DEBUG_STATUS = bool(os.environ.get('PY_VIDEO_DEBUG_STATUS'))
+
+
+def _vlc_instance_args():
+    hwdec = os.environ.get('PY_VIDEO_HWDEC') or _DEFAULT_HWDEC
+    args = ['--avcodec-hw=' + hwdec, '--avcodec-threads=0', '--no-video-title-show', '--quiet',
+            # the window supplies every control: no interface, OSD, snapshot
+            # overlay, media library or input statistics inside libVLC
+            '--intf=dummy', '--no-osd', '--no-snapshot-preview', '--no-media-library', '--no-stats']
+    vout = os.environ.get('PY_VIDEO_VOUT', _DEFAULT_VOUT)
+    if vout:
+        args.append('--vout=' + vout)
+    return args
+
+
+# libVLC 3 runs every preparse on a single background thread and starts an
+# item's parse timeout only once that thread picks it up. The metadata pool is
+# therefore sized to _META_WORKERS = 2 threads rather than to the CPU count:
+# more workers would only wait in that one preparser queue. Probes still queue
+# behind the other metadata worker (3 s each) and the two neighbour prefetches
+# (5 s each), so the client-side deadline in _parse_media, which only guards
+# against a lost MediaParsedChanged, leaves room for that backlog instead of
+# cancelling probes that never got to run. Interactive callers (thumbnails)
+# pass a short backlog_s instead of waiting that long.
+_META_WORKERS = 2
+_PARSE_BACKLOG_S = 15.0
+
+
+def _parse_media(media, timeout_ms=3000, backlog_s=_PARSE_BACKLOG_S):
+    # Replacement for the deprecated blocking media.parse(), which can hang
+    # indefinitely on slow or unreachable files: start libVLC's asynchronous
+    # preparser and wait (bounded) for MediaParsedChanged. Only call this from
+    # worker threads. Returns the duration in ms, 0 when unknown.
+    done = threading.Event()
+    em = media.event_manager()
+    em.event_attach(vlc.EventType.MediaParsedChanged, lambda event: done.set())
+    try:
+        if media.parse_with_options(vlc.MediaParseFlag.local, timeout_ms) != 0:
+            return 0
+        # libVLC reports a timeout through the same event; the extra wait only
+        # covers the preparser backlog and a lost event, in which case the
+        # preparser is told to give up
+        if not done.wait(timeout_ms / 1000.0 + backlog_s):
+            media.parse_stop()
+            return 0
+    finally:
+        em.event_detach(vlc.EventType.MediaParsedChanged)
+    # a timed-out or failed parse can leave a partial (or no) duration behind;
+    # report it as unknown rather than caching a wrong value
+    if media.get_parsed_status() != vlc.MediaParsedStatus.done:
+        return 0
+    return max(media.get_duration() or 0, 0)
+
+
+_VIDEO_EXTS = frozenset(('.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm'))
+
+
+def _is_video_name(name):
+    # hash lookup on the suffix only, instead of lower()-ing the whole name and
+    # trying every extension with endswith
+    i = name.rfind('.')
+    return i >= 0 and name[i:].lower() in _VIDEO_EXTS
+
+
+def _scan_dir(d):
+    # one directory: its mtime, its videos (sorted by name) with their sizes and
+    # its subdirectories. DirEntry type info avoids a stat per entry; the size
+    # comes from the directory listing on Windows and one stat per video elsewhere.
+    subdirs = []
+    videos = []
+    try:
+        mtime = os.stat(d).st_mtime_ns
+        with os.scandir(d) as it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    subdirs.append(e.path)
+                elif _is_video_name(e.name) and e.is_file():
+                    # name test first; is_file() comes from the DirEntry type
+                    # (it only stats symlinks, and skips dangling ones)
+                    try:
+                        size = e.stat().st_size
+                    except OSError:
+                        size = 0
+                    videos.append((e.name, size))
+    except OSError:
+        mtime = 0
+    videos.sort()
+    return mtime, [os.path.join(d, n) for n, _ in videos], [sz for _, sz in videos], subdirs
+
+
+def _scan_videos(folder, max_workers=8):
+    # Directory reads are I/O bound, so fan them out to a small pool; results are
+    # stitched back in the previous os.walk order (a directory's videos before
+    # its subdirectories) so the playlist order does not depend on timing.
+    # Returns (files, {directory: mtime_ns}, sizes parallel to files).
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pyvid-scan') as pool:
+        pending = {pool.submit(_scan_dir, folder): folder}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                d = pending.pop(fut)
+                mtime, files, sizes, subdirs = fut.result()
+                results[d] = (mtime, files, sizes, subdirs)
+                for sd in subdirs:
+                    pending[pool.submit(_scan_dir, sd)] = sd
+    ordered = []
+    ordered_sizes = []
+    stack = [folder]
+    while stack:
+        _, files, sizes, subdirs = results[stack.pop()]
+        ordered.extend(files)
+        ordered_sizes.extend(sizes)
+        stack.extend(reversed(subdirs))
+    return ordered, {d: r[0] for d, r in results.items()}, ordered_sizes
+
+
+def _stat_one(path):
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _stat_all(paths, max_workers=8):
+    # os.stat for each path (None where it fails), in order. A large batch, such
+    # as a multi-select or drop from a network share, fans out: stat is I/O bound.
+    if len(paths) < 16:
+        return [_stat_one(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pyvid-scan') as pool:
+        return list(pool.map(_stat_one, paths))
+
+
+def _cache_dir():
+    base = QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.CacheLocation)
+    if not base:
+        base = os.path.join(tempfile.gettempdir(), 'py_video')
+    os.makedirs(base, exist_ok=True)
+    return base
+
+
+# GUI process on Windows: without CREATE_NO_WINDOW every ffmpeg run also
+# allocates (and flashes) a console window
+_SUBPROCESS_FLAGS = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+THUMB_CACHE_MAX = 200
+THUMB_BUCKET_MS = 500
+
+
+def _thumb_cache_path(cachedir, path, t_ms):
+    # keyed by file identity and a coarse time bucket: scrubbing revisits the
+    # same buckets, and rewriting the file (new mtime) invalidates its entries
+    # stable across runs, unlike hash(); surrogatepass keeps undecodable
+    # (non-UTF-8) file names hashable
+    ident = f'{path}|{os.stat(path).st_mtime_ns}|{t_ms}'.encode('utf-8', 'surrogatepass')
+    key = hashlib.blake2b(ident, digest_size=8).hexdigest()
+    return os.path.join(cachedir, f'thumb_{key}.jpg')
+
+
+def _prune_thumbnails(cachedir, keep=THUMB_CACHE_MAX):
+    # cache hits touch the file, so mtime order is least-recently-used order
+    try:
+        entries = [e for e in os.scandir(cachedir) if e.name.startswith('thumb_') and e.is_file()]
+        entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    except OSError:
+        return
+    for e in entries[keep:]:
+        try:
+            os.remove(e.path)
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_seconds(total, _div=divmod):
+    # one entry per displayed second; scrubbing back and forth and the
+    # per-media length string hit the cache instead of re-formatting
+    m, s = _div(total, 60)
+    h, m = _div(m, 60)
+    return f"{h:02d}:{m:02d}:{s:02d}" if h else f"{m:02d}:{s:02d}"
+
+
+class MediaCache:
+    # SQLite store shared by the worker threads (one connection behind a lock).
+    # A folder scan stays valid while every directory it visited keeps its mtime:
+    # creating, deleting or renaming an entry bumps the parent directory's mtime,
+    # so revalidating costs one stat per directory instead of a full listing.
+    # Probed durations are keyed by path and only trusted while the file's
+    # mtime and size still match.
+    META_MAX_ROWS = 20000
+
+    def __init__(self, path):
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            # WAL + NORMAL: the many small per-file writes do not each wait for an fsync
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('PRAGMA synchronous=NORMAL')
+            self._db.execute('CREATE TABLE IF NOT EXISTS folders (folder TEXT PRIMARY KEY, dirs TEXT, files TEXT)')
+            self._db.execute('CREATE TABLE IF NOT EXISTS meta (path TEXT PRIMARY KEY, mtime INTEGER, '
+                             'size INTEGER, duration INTEGER)')
+            # INSERT OR REPLACE gives a row a fresh rowid, so rowid order is
+            # probe order: keep only the most recently probed entries
+            self._db.execute('DELETE FROM meta WHERE rowid <= (SELECT rowid FROM meta ORDER BY rowid DESC '
+                             'LIMIT 1 OFFSET ?)', (self.META_MAX_ROWS,))
+            self._db.commit()
+
+    def get_folder(self, folder):
+        with self._lock:
+            row = self._db.execute('SELECT dirs, files FROM folders WHERE folder = ?', (folder,)).fetchone()
+        if not row:
+            return None
+        try:
+            for d, mtime in json.loads(row[0]).items():
+                if os.stat(d).st_mtime_ns != mtime:
+                    return None
+            return json.loads(row[1])
+        except (OSError, ValueError):
+            return None
+
+    def put_folder(self, folder, dirs, files):
+        with self._lock:
+            self._db.execute('INSERT OR REPLACE INTO folders (folder, dirs, files) VALUES (?, ?, ?)',
+                             (folder, json.dumps(dirs), json.dumps(files)))
+            self._db.commit()
+
+    def get_duration(self, path, mtime, size):
+        with self._lock:
+            row = self._db.execute('SELECT duration FROM meta WHERE path = ? AND mtime = ? AND size = ?',
+                                   (path, mtime, size)).fetchone()
+        return row[0] if row else None
+
+    def put_duration(self, path, mtime, size, duration):
+        with self._lock:
+            self._db.execute('INSERT OR REPLACE INTO meta (path, mtime, size, duration) VALUES (?, ?, ?, ?)',
+                             (path, mtime, size, duration))
+            self._db.commit()
+
+
 class Backend(QtCore.QObject):
-    def __init__(self, instance, player, quick_widget, video_frame, player_window=None):
+    MEDIA_CACHE_SIZE = 4
+
+    def __init__(self, instance, player, quick_widget, video_frame, player_window=None, media_cache=None):
         super().__init__()
+        # persistent MediaCache (or None): probed durations survive restarts
+        self._disk_cache = media_cache
         self.instance = instance
         self.player = player
         self.quick_widget = quick_widget
         self.video_frame = video_frame
         self.player_window = player_window  # Reference to PlayerWindow for update_status
+        # QML root object, cached while the view is Ready so hot paths skip the
+        # rootObject() bridge call; None while QML is loading or failed
+        self.qml_root = quick_widget.rootObject()
+        quick_widget.statusChanged.connect(self._on_qml_status)
         self.playlist = []
+        # companion path -> row index for O(1) duplicate checks and row lookup,
+        # kept in sync with self.playlist
+        self._index_by_path = {}
         self.current_index = -1
+        # single worker so libVLC player calls stay ordered and off the Qt thread
+        self._player_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pyvid-player')
+        self._open_seq = 0
+        self._current_path = None
+        # latest volume not yet applied by the player worker
+        self._pending_volume = None
+        self._volume_lock = threading.Lock()
+        # path -> duration in ms, filled by the metadata probe and reused by
+        # thumbnail requests instead of parsing the file again
+        self._duration_cache = {}
+        # path -> byte size known from the add-time stat, folder scan or probe,
+        # so a QML (re)load can show it without waiting for the metadata pass
+        self._size_by_path = {}
+        # bounded pools for background probing: metadata for newly added rows,
+        # thumbnails for slider previews. The semaphore caps live ffmpeg
+        # processes whatever thread _generate_thumbnail runs on.
+        # the duration probes all funnel into libVLC's one preparser thread, so
+        # more workers would only queue there (see _PARSE_BACKLOG_S)
+        self._meta_pool = ThreadPoolExecutor(max_workers=_META_WORKERS, thread_name_prefix='pyvid-meta')
+        # neighbour pre-parse gets its own worker: behind the probe backlog of a
+        # large folder it would run long after the user moved on. It only starts
+        # libVLC's asynchronous parse, so one thread is plenty
+        self._prefetch_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pyvid-prefetch')
+        self._closing = False
+        # finished metadata probes waiting for the next _flush_metadata
+        self._meta_results = []
+        self._meta_lock = threading.Lock()
+        thumb_workers = min(4, os.cpu_count() or 2)
+        self._thumb_pool = ThreadPoolExecutor(max_workers=thumb_workers, thread_name_prefix='pyvid-thumb')
+        # at most half the cores run ffmpeg at once (the playing video needs the
+        # rest); each process gets an equal share of threads within that half
+        cpus = os.cpu_count() or 2
+        ffmpeg_slots = max(1, min(thumb_workers, cpus // 2))
+        self._ffmpeg_sem = threading.BoundedSemaphore(ffmpeg_slots)
+        self._ffmpeg_threads = max(1, cpus // 2 // ffmpeg_slots)
+        # resolved once; a PATH search per thumbnail is wasted work
+        self._ffmpeg = shutil.which('ffmpeg')
+        # scrubbing fires many thumbnail requests; they are coalesced to the
+        # latest one per 80 ms window. The window is not restarted by later
+        # requests, so a continuous drag still previews ~12 times a second.
+        # Every request bumps the generation so queued or running workers for
+        # older ones bail out before starting ffmpeg.
+        self._thumb_gen = 0
+        self._thumb_gen_lock = threading.Lock()
+        self._pending_thumb = None
+        self._thumb_timer = QtCore.QTimer(self)
+        self._thumb_timer.setSingleShot(True)
+        self._thumb_timer.setInterval(80)
+        self._thumb_timer.timeout.connect(self._flush_thumbnail)
+        try:
+            self._thumb_dir = os.path.join(_cache_dir(), 'thumbs')
+            os.makedirs(self._thumb_dir, exist_ok=True)
+        except OSError:
+            self._thumb_dir = tempfile.gettempdir()
+        self._thumb_pool.submit(_prune_thumbnails, self._thumb_dir)
+        self._thumb_lru = OrderedDict()
+        self._thumb_lru_lock = threading.Lock()
+        # two [player, loaded path] slots on the shared instance for the
+        # snapshot fallback (no ffmpeg). The players are created on first use
+        # (None until then), so an ffmpeg setup never holds any
+        self._snap_pool = queue.Queue()
+        for _ in range(2):
+            self._snap_pool.put(None)
+        # small LRU of pre-parsed vlc.Media for the playlist neighbours
+        self._media_cache = OrderedDict()
+        self._media_lock = threading.Lock()
+        # toast messages are coalesced through a single-shot timer
+        self._pending_toast = None
+        self._toast_timer = QtCore.QTimer(self)
+        self._toast_timer.setSingleShot(True)
+        self._toast_timer.setInterval(100)
+        self._toast_timer.timeout.connect(self._flush_toast)
         # attach VLC end-of-media event to trigger next playback
         try:
             self.em = self.player.event_manager()
@@ -53,101 +400,197 @@ class Backend(QtCore.QObject):
         except Exception:
             self.em = None
 
+    def shutdown(self):
+        # executor threads are joined at interpreter exit; make sure a deep
+        # backlog of metadata/thumbnail jobs does not hold the exit up.
+        # Idempotent: called from closeEvent and again on aboutToQuit.
+        if self._closing:
+            return
+        self._closing = True
+        with self._thumb_gen_lock:
+            self._thumb_gen += 1
+        self._thumb_timer.stop()
+        self._meta_pool.shutdown(wait=False)
+        self._prefetch_exec.shutdown(wait=False)
+        self._thumb_pool.shutdown(wait=False)
+        # queued opens are dropped by the sequence check; the player worker
+        # only finishes the call it is in and then a final stop
+        self._open_seq += 1
+        self._player_exec.submit(self.player.stop)
+        self._player_exec.shutdown(wait=False)
+
+    def _on_qml_status(self, status):
+        self.qml_root = root = self.quick_widget.rootObject() if status == QQuickWidget.Ready else None
+        # a freshly loaded root starts with an empty model: hand it everything
+        # added while QML was loading in one batch
+        if root and self.playlist:
+            try:
+                root.addItems([{'name': os.path.basename(p), 'path': p,
+                                'duration': self._duration_cache.get(p, 0),
+                                'size': self._size_by_path.get(p, 0)}
+                               for p in self.playlist])
+                if self.current_index >= 0:
+                    root.setCurrentIndex(self.current_index)
+            except Exception as e:
+                print('Error calling QML addItems:', e)
+
     @Slot('QStringList')
-    def addFiles(self, paths):
-        for p in paths:
-            self.addFile(p)
+    def addFiles(self, paths, verified=False, sizes=None):
+        # append everything first, then hand QML one batch so the ListView
+        # relayouts once instead of once per file.
+        # verified=True: paths come straight from a directory listing, skip the stat
+        # sizes: optional byte sizes parallel to paths, already known from the scan
+        items = []
+        stats = []
+        rejected = 0
+        if not verified:
+            # unverified paths (dialog, QML, drops) are filtered by extension and
+            # duplicates before any stat, so junk in a mixed selection never
+            # reaches libVLC. The one stat doubles as the existence check and is
+            # handed on to the metadata probe.
+            fresh = [p for p in paths if p not in self._index_by_path]
+            paths = [p for p in fresh if _is_video_name(p)]
+            rejected = len(fresh) - len(paths)
+            pre_stats = dict(zip(paths, _stat_all(paths)))
+        for i, path in enumerate(paths):
+            # duplicate check first: it is a dict lookup, the existence check a stat
+            if path in self._index_by_path:
+                continue
+            st = None
+            if not verified:
+                st = pre_stats[path]
+                # regular files only: a directory named like a video
+                # (e.g. an extracted "Movie.mkv/") is not a playlist row
+                if st is None or not stat.S_ISREG(st.st_mode):
+                    rejected += 1
+                    continue
+            self._index_by_path[path] = len(self.playlist)
+            self.playlist.append(path)
+            # add with placeholder duration (and size, unless known), updated later
+            size = st.st_size if st is not None else (sizes[i] if sizes else 0)
+            self._size_by_path[path] = size
+            items.append({'name': os.path.basename(path), 'path': path, 'duration': 0, 'size': size})
+            stats.append(st)
+        if items:
+            self._push_items(items)
+            self._start_metadata(items, stats)
+        if rejected:
+            # replaces the 'Added' toast (last message wins), so say both
+            if items:
+                self._queue_toast('Added %d, skipped %d unsupported file(s)' % (len(items), rejected))
+            else:
+                self._queue_toast('Skipped %d unsupported file(s)' % rejected)
 
     @Slot(str)
     def addFile(self, path):
-        if not os.path.exists(path):
-            return
-        if path in self.playlist:
-            return
-        index = len(self.playlist)
-        self.playlist.append(path)
-        root = self.quick_widget.rootObject()
+        self.addFiles([path])
+
+    def _push_items(self, items):
+        root = self.qml_root
         if root:
-            # add with placeholder duration/size (updated later)
             try:
-                root.addItem(os.path.basename(path), path, 0, 0)
+                root.addItems(items)
                 # show a small toast so user sees the add event
-                try:
-                    root.showToast('Added: ' + os.path.basename(path))
-                except Exception:
-                    pass
+                if len(items) == 1:
+                    self._queue_toast('Added: ' + items[0]['name'])
+                else:
+                    self._queue_toast('Added %d files' % len(items))
             except Exception as e:
-                print('Error calling QML addItem:', e)
-        else:
-            # QML not ready yet; schedule a retry shortly on the main thread
-            print('Warning: QML rootObject() is None; scheduling add for', path)
+                print('Error calling QML addItems:', e)
+        # QML not ready yet: nothing to retry, the items are already in
+        # self.playlist and _on_qml_status flushes it once the root is Ready
+
+    def _start_metadata(self, items, stats):
+        # collect metadata in background (size + duration); one map call
+        # queues the whole batch
+        if self._closing:
+            return
+        self._meta_pool.map(self._collect_metadata, [it['path'] for it in items],
+                            [it['size'] for it in items], stats)
+
+    def _collect_metadata(self, path, size=0, st=None):
+        # queued probes for a large add drain as no-ops once the window closes,
+        # and for rows removed (or a playlist cleared) before they ran
+        if self._closing or path not in self._index_by_path:
+            return
+        # st: the stat taken when the row was added, if any
+        if st is None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                st = None
+        if st is not None:
+            size = st.st_size
+            # plain dict store from the worker, as with _duration_cache
+            self._size_by_path[path] = size
+        duration = self._probe_duration(path, st)
+        # notify QML on main thread; results that finish close together share
+        # one queued call and one QML crossing
+        with self._meta_lock:
+            schedule = not self._meta_results
+            self._meta_results.append((path, duration, size))
+        if schedule:
             try:
-                def _delayed_add():
-                    rt = self.quick_widget.rootObject()
-                    if rt:
-                        try:
-                            rt.addItem(os.path.basename(path), path, 0, 0)
-                            try:
-                                rt.showToast('Added: ' + os.path.basename(path))
-                            except Exception:
-                                pass
-                        except Exception as e:
-                            print('Error calling delayed QML addItem:', e)
-                    else:
-                        print('Delayed add still could not find QML root for', path)
-                QtCore.QTimer.singleShot(200, _delayed_add)
+                QtCore.QMetaObject.invokeMethod(self, '_flush_metadata', QtCore.Qt.QueuedConnection)
             except Exception:
                 pass
-        # collect metadata in background (size + duration)
-        t = threading.Thread(target=self._collect_metadata, args=(path, index), daemon=True)
-        t.start()
-        # keep reference to thread to avoid GC (optional)
-        try:
-            self._threadpool
-        except AttributeError:
-            self._threadpool = []
-        self._threadpool.append(t)
-
-    def _collect_metadata(self, path, index):
-        size = 0
-        duration = 0
-        try:
-            size = os.path.getsize(path)
-        except Exception:
-            size = 0
-        # try to get duration via VLC media parse (may block briefly)
-        try:
-            m = self.instance.media_new(path)
+
+    def _probe_duration(self, path, st=None, backlog_s=_PARSE_BACKLOG_S):
+        # duration in ms, 0 when unknown: in-memory cache, then the persistent
+        # cache (valid while mtime and size match), then a bounded libVLC parse
+        duration = self._duration_cache.get(path, 0)
+        if duration > 0:
+            return duration
+        cache = self._disk_cache
+        if cache is not None:
             try:
-                m.parse()
+                st = st or os.stat(path)
+                duration = cache.get_duration(path, st.st_mtime_ns, st.st_size) or 0
+            except (OSError, sqlite3.Error):
+                st = None
+        if duration <= 0:
+            try:
+                duration = _parse_media(self.instance.media_new(path), backlog_s=backlog_s)
             except Exception:
-                pass
-            dur = m.get_duration()
-            if dur and dur > 0:
-                duration = dur
-        except Exception:
-            duration = 0
-        # notify QML on main thread
-        try:
-            QtCore.QMetaObject.invokeMethod(self, 'updateMetadata', QtCore.Qt.QueuedConnection,
-                                             QtCore.Q_ARG(int, index), QtCore.Q_ARG(int, duration), QtCore.Q_ARG(int, size))
-        except Exception:
-            pass
+                duration = 0
+            # 0 means unknown (failed, timed out or cancelled parse): never cached,
+            # the next add of the file probes again
+            if duration > 0 and cache is not None and st is not None:
+                try:
+                    cache.put_duration(path, st.st_mtime_ns, st.st_size, duration)
+                except sqlite3.Error:
+                    pass
+        if duration > 0:
+            self._duration_cache[path] = duration
+        return duration
 
-    @Slot(int, int, int)
-    def updateMetadata(self, index, durationMs, sizeBytes):
-        root = self.quick_widget.rootObject()
-        if root:
+    @Slot()
+    def _flush_metadata(self):
+        with self._meta_lock:
+            results, self._meta_results = self._meta_results, []
+        # rows are resolved by path now, so moves/removals since the add are harmless
+        rows = []
+        for path, duration, size in results:
+            index = self._index_by_path.get(path)
+            if index is not None:
+                rows.append([index, duration, size])
+        root = self.qml_root
+        if root and rows:
             try:
-                root.updateItemMetadata(index, durationMs, sizeBytes)
+                root.updateItemsMetadata(rows)
             except Exception:
                 pass
 
     @Slot(int)
     def playAt(self, index):
         if 0 <= index < len(self.playlist):
+            path = self.playlist[index]
+            # double-clicking the item that is already playing must not tear down
+            # and re-probe the media
+            if path == self._current_path and self.player.is_playing():
+                return
             self.current_index = index
-            self.open_path(self.playlist[index])
+            self.open_path(path, verified=True)
 
     def _vlc_end_callback(self, event):
         try:
@@ -164,14 +607,7 @@ class Backend(QtCore.QObject):
 
             self.current_index = (self.current_index + 1) % len(self.playlist)
             next_path = self.playlist[self.current_index]
-            self.open_path(next_path)
-            # show toast in QML
-            try:
-                root = self.quick_widget.rootObject()
-                if root:
-                    root.showToast('Playing: ' + os.path.basename(next_path))
-            except Exception:
-                pass
+            self.open_path(next_path, verified=True)
         except Exception:
             pass
         
@@ -181,35 +617,72 @@ class Backend(QtCore.QObject):
         try:
             if not (0 <= index < len(self.playlist)):
                 return
-            path = self.playlist[index]
-            # get duration via media; fallback to 0
-            length = 0
-            try:
-                m = self.instance.media_new(path)
-                try:
-                    m.parse()
-                except Exception:
-                    pass
-                length = m.get_duration() or 0
-            except Exception:
-                length = 0
-            if length > 0:
-                t_ms = int((percent / 100.0) * length)
-            else:
-                t_ms = 0
-            threading.Thread(target=self._generate_thumbnail, args=(path, t_ms), daemon=True).start()
+            with self._thumb_gen_lock:
+                self._thumb_gen += 1
+                gen = self._thumb_gen
+            self._pending_thumb = (self.playlist[index], percent, gen)
+            if not self._thumb_timer.isActive():
+                self._thumb_timer.start()
         except Exception:
             pass
 
-    def _generate_thumbnail(self, path, t_ms):
-        outdir = tempfile.gettempdir()
-        outpath = os.path.join(outdir, f"thumb_{abs(hash(path))}_{t_ms}.jpg")
-        ffmpeg = shutil.which('ffmpeg')
-        if ffmpeg:
+    def _flush_thumbnail(self):
+        pending, self._pending_thumb = self._pending_thumb, None
+        if pending is not None:
+            # parsing for the duration happens on the worker, not on the Qt thread
+            self._thumb_pool.submit(self._thumbnail_worker, *pending)
+
+    def _thumb_stale(self, gen):
+        return gen is not None and gen != self._thumb_gen
+
+    def _thumbnail_worker(self, path, percent, gen=None):
+        if self._thumb_stale(gen):
+            return
+        # the playing file's length is already known to the player; otherwise
+        # probe, but without the metadata backlog allowance: a preview worker must
+        # not sit ~18 s on a lost MediaParsedChanged
+        length = self.player.get_length() if path == self._current_path else 0
+        if length is None or length <= 0:
+            length = self._probe_duration(path, backlog_s=0.5)
+        if length > 0:
+            t_ms = int((percent / 100.0) * length) // THUMB_BUCKET_MS * THUMB_BUCKET_MS
+        else:
+            t_ms = 0
+        self._generate_thumbnail(path, t_ms, gen)
+
+    def _generate_thumbnail(self, path, t_ms, gen=None):
+        try:
+            outpath = _thumb_cache_path(self._thumb_dir, path, t_ms)
+        except OSError:
+            return
+        ffmpeg = self._ffmpeg
+        if os.path.exists(outpath):
+            # cache hit: refresh its LRU position and deliver straight away
+            try:
+                os.utime(outpath)
+            except OSError:
+                pass
+        elif ffmpeg:
             sec = max(0, t_ms / 1000.0)
-            cmd = [ffmpeg, '-ss', str(sec), '-i', path, '-frames:v', '1', '-q:v', '2', outpath, '-y']
+            # input-side -ss with -noaccurate_seek lands on the keyframe at or
+            # before the target and emits it as-is (with -skip_frame nokey an
+            # accurate seek would wait for the *next* keyframe); audio/subtitles
+            # are never opened. Decoder and encoder threads are capped so the pool's
+            # processes together stay within the cores (input and output
+            # -threads are separate options). Small preview, modest JPEG quality.
+            threads = str(self._ffmpeg_threads)
+            cmd = [ffmpeg, '-nostdin', '-hide_banner', '-loglevel', 'error',
+                   '-noaccurate_seek', '-ss', str(sec), '-skip_frame', 'nokey', '-an', '-sn',
+                   '-threads', threads,
+                   '-i', path, '-threads', threads, '-frames:v', '1', '-vf', 'scale=160:-2', '-q:v', '5',
+                   '-f', 'image2', outpath, '-y']
             try:
-                subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=8)
+                with self._ffmpeg_sem:
+                    # a newer request may have arrived while waiting for a slot
+                    if self._thumb_stale(gen):
+                        return
+                    subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.DEVNULL, timeout=8, creationflags=_SUBPROCESS_FLAGS)
             except Exception:
                 try:
                     if os.path.exists(outpath):
@@ -218,39 +691,88 @@ class Backend(QtCore.QObject):
                     pass
         else:
             # fallback using libVLC snapshot (may be slow and intrusive)
-            try:
-                tmp_instance = vlc.Instance()
-                tmp_player = tmp_instance.media_player_new()
-                m = tmp_instance.media_new(path)
-                tmp_player.set_media(m)
-                tmp_player.play()
-                QtCore.QThread.msleep(200)
-                try:
-                    tmp_player.set_time(int(t_ms))
-                    QtCore.QThread.msleep(200)
-                except Exception:
-                    pass
-                try:
-                    tmp_player.video_take_snapshot(0, outpath, 160, 90)
-                except Exception:
-                    pass
-                try:
-                    tmp_player.stop()
-                except Exception:
-                    pass
-            except Exception:
-                pass
+            if self._thumb_stale(gen):
+                return
+            self._vlc_snapshot(path, t_ms, outpath)
         # deliver to QML
         try:
             if os.path.exists(outpath):
+                self._touch_thumbnail(outpath)
                 QtCore.QMetaObject.invokeMethod(self, '_deliver_thumbnail', QtCore.Qt.QueuedConnection,
                                                  QtCore.Q_ARG(str, outpath))
         except Exception:
             pass
 
+    def _touch_thumbnail(self, outpath):
+        # session LRU over the thumbnail files: the startup prune bounds what is
+        # left from earlier runs, this bounds what a long scrubbing session adds
+        with self._thumb_lru_lock:
+            self._thumb_lru[outpath] = None
+            self._thumb_lru.move_to_end(outpath)
+            evict = []
+            while len(self._thumb_lru) > THUMB_CACHE_MAX:
+                evict.append(self._thumb_lru.popitem(last=False)[0])
+        for old in evict:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
+
+    def _vlc_snapshot(self, path, t_ms, outpath):
+        # borrow one of the pre-created players on the shared instance; a busy
+        # pool means another snapshot is running and a newer request will follow
+        try:
+            slot = self._snap_pool.get(timeout=2.0)
+        except queue.Empty:
+            return
+        if slot is None:
+            slot = [self.instance.media_player_new(), None]
+        snap, loaded = slot
+        # wait on libVLC events instead of fixed sleeps: the video output
+        # exists (new media only), then a frame near t_ms was displayed.
+        # The callbacks only signal; libVLC is driven from this thread.
+        vout_ready = threading.Event()
+        at_time = threading.Event()
+        target = int(t_ms)
+
+        def _on_time(event):
+            if abs(event.u.new_time - target) < 200:
+                at_time.set()
+
+        try:
+            em = snap.event_manager()
+            em.event_attach(vlc.EventType.MediaPlayerVout, lambda event: vout_ready.set())
+            em.event_attach(vlc.EventType.MediaPlayerTimeChanged, _on_time)
+            try:
+                if path != loaded:
+                    media = self.instance.media_new(path)
+                    media.add_option(':no-audio')
+                    snap.set_media(media)
+                    slot[1] = path
+                # stop() below tears the video output down, so every run waits
+                # for it again; only the media object is reused
+                snap.play()
+                vout_ready.wait(2.0)
+                snap.set_time(target)
+                at_time.wait(2.0)
+                snap.video_take_snapshot(0, outpath, 160, 90)
+            finally:
+                em.event_detach(vlc.EventType.MediaPlayerVout)
+                em.event_detach(vlc.EventType.MediaPlayerTimeChanged)
+        except Exception:
+            pass
+        finally:
+            # stop, not pause: a paused player keeps its decoder, a stray video
+            # output window and an open handle on the file (locked on Windows)
+            try:
+                snap.stop()
+            except Exception:
+                pass
+            self._snap_pool.put(slot)
+
     @Slot(str)
     def _deliver_thumbnail(self, outpath):
-        root = self.quick_widget.rootObject()
+        root = self.qml_root
         if root:
             try:
                 root.showThumb(outpath)
@@ -258,6 +780,14 @@ class Backend(QtCore.QObject):
                 pass
     @Slot(float)
     def setPositionPercent(self, percent):
+        # set_time starts a demuxer seek; like every other libVLC transport call it
+        # runs on the player worker, in submission order. After shutdown() the
+        # executors refuse new work, so late timers/QML calls are dropped here
+        if self._closing:
+            return
+        self._player_exec.submit(self._seek_percent, percent)
+
+    def _seek_percent(self, percent):
         try:
             length = self.player.get_length()
             if length > 0:
@@ -266,20 +796,84 @@ class Backend(QtCore.QObject):
         except Exception:
             pass
 
+    def seek_by(self, ms):
+        if self._closing:
+            return
+        self._player_exec.submit(self._seek_by, ms)
+
+    def _seek_by(self, ms):
+        try:
+            # Check if player has media loaded
+            if not self.player.get_media():
+                return
+            cur = self.player.get_time()
+            if cur is None or cur < 0:
+                cur = 0
+            length = self.player.get_length()
+            if length is None or length < 0:
+                length = 0
+            new = max(0, cur + ms)
+            if length > 0:
+                new = min(new, length - 100)
+            self.player.set_time(int(new))
+        except Exception as e:
+            print(f"Seek error: {e}")
+
+    def set_playing(self, playing):
+        # the caller passes the wanted state, so a queued toggle cannot invert itself
+        if self._closing:
+            return
+        self._player_exec.submit(self._set_playing, playing)
+
+    def _set_playing(self, playing):
+        try:
+            if playing:
+                self.player.play()
+            else:
+                self.player.set_pause(1)
+        except Exception as e:
+            print(f"Play/pause error: {e}")
+
     @Slot(float)
     def setVolumePercent(self, percent):
-        try:
-            vol = int(max(0, min(100, percent)))
-            self.player.audio_set_volume(vol)
-        except Exception:
-            pass
+        # audio_set_volume can block on the audio mixer; run it on the player worker.
+        # Rapid changes collapse: only the latest value reaches libVLC.
+        if self._closing:
+            return
+        vol = int(max(0, min(100, percent)))
+        with self._volume_lock:
+            submit = self._pending_volume is None
+            self._pending_volume = vol
+        if submit:
+            self._player_exec.submit(self._apply_volume)
+
+    def _apply_volume(self):
+        with self._volume_lock:
+            vol, self._pending_volume = self._pending_volume, None
+        if vol is not None:
+            try:
+                self.player.audio_set_volume(vol)
+            except Exception:
+                pass
+
+    def volume_pending(self):
+        return self._pending_volume is not None
+
+    def index_of(self, path):
+        return self._index_by_path.get(path, -1)
 
     @Slot(int)
     def removeAt(self, index):
         if 0 <= index < len(self.playlist):
             try:
+                del self._index_by_path[self.playlist[index]]
+                self._size_by_path.pop(self.playlist[index], None)
                 del self.playlist[index]
-                root = self.quick_widget.rootObject()
+                # rows after the removed one shift up (removal is rare; adds stay O(1))
+                for i in range(index, len(self.playlist)):
+                    self._index_by_path[self.playlist[i]] = i
+                self._sync_current_index()
+                root = self.qml_root
                 if root:
                     root.removeItem(index)
             except Exception:
@@ -290,7 +884,10 @@ class Backend(QtCore.QObject):
         if 1 <= index < len(self.playlist):
             try:
                 self.playlist[index-1], self.playlist[index] = self.playlist[index], self.playlist[index-1]
-                root = self.quick_widget.rootObject()
+                self._index_by_path[self.playlist[index-1]] = index-1
+                self._index_by_path[self.playlist[index]] = index
+                self._sync_current_index()
+                root = self.qml_root
                 if root:
                     root.moveUp(index)
             except Exception:
@@ -301,83 +898,168 @@ class Backend(QtCore.QObject):
         if 0 <= index < len(self.playlist)-1:
             try:
                 self.playlist[index], self.playlist[index+1] = self.playlist[index+1], self.playlist[index]
-                root = self.quick_widget.rootObject()
+                self._index_by_path[self.playlist[index]] = index
+                self._index_by_path[self.playlist[index+1]] = index+1
+                self._sync_current_index()
+                root = self.qml_root
                 if root:
                     root.moveDown(index)
             except Exception:
                 pass
 
+    def _sync_current_index(self):
+        # keep the playing row correct after removals/reorders
+        if self._current_path is not None:
+            self.current_index = self._index_by_path.get(self._current_path, -1)
+
     @Slot()
     def clearPlaylist(self):
-        self.player.stop()
+        # cancel any queued open and stop on the player worker, keeping call order
+        if self._closing:
+            return
+        self._open_seq += 1
+        self._player_exec.submit(self.player.stop)
+        self._current_path = None
         self.playlist.clear()
+        self._index_by_path.clear()
+        self._duration_cache.clear()
+        self._size_by_path.clear()
         self.current_index = -1
-        root = self.quick_widget.rootObject()
+        root = self.qml_root
         if root:
             try:
                 root.clearPlaylist()
             except Exception as e:
                 print(f"Error calling QML clearPlaylist: {e}")
 
-    def open_path(self, path):
-        if not os.path.exists(path):
+    def open_path(self, path, verified=False):
+        # verified=True: the path comes from the playlist, which was existence-checked
+        # on add; a file removed since then just fails to open on the worker
+        if self._closing or (not verified and not os.path.exists(path)):
             return
-        self.player.stop()
-        media = self.instance.media_new(path)
-        # Parse media to get duration information
-        try:
-            media.parse()
-        except Exception:
-            pass
-        self.player.set_media(media)
-        # set video output window (Windows / Linux / macOS handled by instance)
-        try:
-            if sys.platform.startswith('win'):
-                self.player.set_hwnd(int(self.video_frame.winId()))
-            elif sys.platform.startswith('linux'):
-                self.player.set_xwindow(int(self.video_frame.winId()))
-            elif sys.platform.startswith('darwin'):
-                self.player.set_nsobject(int(self.video_frame.winId()))
-        except Exception:
-            pass
-        self.player.play()
-        # Force status updates after delays to get time info as media loads
-        if self.player_window:
-            QtCore.QTimer.singleShot(500, self.player_window.update_status)
-            QtCore.QTimer.singleShot(1000, self.player_window.update_status)
-            QtCore.QTimer.singleShot(2000, self.player_window.update_status)
+        # libVLC stop()/set_media()/play() can stall for hundreds of ms, so run them on
+        # the player worker; a newer open supersedes any that has not started yet
+        self._open_seq += 1
+        self._player_exec.submit(self._open_worker, path, self._open_seq)
+        self._current_path = path
         # update current_index if path is in playlist
-        try:
-            if path in self.playlist:
-                self.current_index = self.playlist.index(path)
-            else:
-                self.current_index = -1
-        except Exception:
-            self.current_index = -1
+        self.current_index = self._index_by_path.get(path, -1)
         # show toast in QML about current playing
         try:
-            root = self.quick_widget.rootObject()
+            root = self.qml_root
             if root:
-                root.showToast('Playing: ' + os.path.basename(path))
                 root.setCurrentIndex(self.current_index)
         except Exception:
             pass
+        self._queue_toast('Playing: ' + os.path.basename(path))
+
+    def _queue_toast(self, msg):
+        # bursts (add + play, track changes) collapse into one QML toast update;
+        # the last message wins
+        self._pending_toast = msg
+        if not self._toast_timer.isActive():
+            self._toast_timer.start()
+
+    def _flush_toast(self):
+        msg, self._pending_toast = self._pending_toast, None
+        root = self.qml_root
+        if msg and root:
+            try:
+                root.showToast(msg)
+            except Exception:
+                pass
+
+    def _open_worker(self, path, seq):
+        # runs on the player worker thread
+        if seq != self._open_seq:
+            return
+        try:
+            self.player.stop()
+            # reuse a media object pre-parsed by _prefetch_neighbors when available
+            with self._media_lock:
+                media = self._media_cache.pop(path, None)
+            if media is None:
+                media = self.instance.media_new(path)
+            # no parse here: the demuxer opened by play() probes the container
+            # anyway, and the length arrives via MediaPlayerLengthChanged
+            # the video output window is bound once by PlayerWindow._bind_video_output
+            self.player.set_media(media)
+            self.player.play()
+        except Exception as e:
+            print(f"Error opening {path}: {e}")
+            return
+        try:
+            QtCore.QMetaObject.invokeMethod(self, '_on_opened', QtCore.Qt.QueuedConnection)
+        except Exception:
+            pass
+
+    @Slot()
+    def _on_opened(self):
+        if self.player_window:
+            self.player_window.play_btn.setText('Pause')
+            # no delayed status polls: MediaPlayerPlaying and LengthChanged push
+            # the status as soon as libVLC actually knows it
+        QtCore.QTimer.singleShot(500, self._prefetch_neighbors)
+
+    def _prefetch_neighbors(self):
+        # pre-create and pre-parse the previous/next items so switching to them
+        # does not wait for container probing; the 500 ms timer from _on_opened
+        # can still fire after shutdown()
+        if self._closing or not self.playlist or self.current_index < 0:
+            return
+        n = len(self.playlist)
+        paths = []
+        for i in (self.current_index + 1, self.current_index - 1):
+            p = self.playlist[i % n]
+            if p != self._current_path and p not in paths:
+                paths.append(p)
+        with self._media_lock:
+            paths = [p for p in paths if p not in self._media_cache]
+        if paths:
+            self._prefetch_exec.submit(self._prefetch_worker, paths)
+
+    def _prefetch_worker(self, paths):
+        for path in paths:
+            try:
+                media = self.instance.media_new(path)
+                # asynchronous: libVLC's preparser does the work in the background
+                media.parse_with_options(vlc.MediaParseFlag.local, 5000)
+            except Exception:
+                continue
+            with self._media_lock:
+                self._media_cache[path] = media
+                self._media_cache.move_to_end(path)
+                while len(self._media_cache) > self.MEDIA_CACHE_SIZE:
+                    self._media_cache.popitem(last=False)
 
 class PlayerWindow(QtWidgets.QWidget):
     SEEK_MS = 5000
     VOL_STEP = 10
+    STATUS_THROTTLE_MS = 100
+    STATUS_HEARTBEAT_MS = 2000
 
     def __init__(self):
         super().__init__()
         self.setAcceptDrops(True)
         self.setWindowTitle('Py Video Player (QML Demo)')
-        self.resize(1000, 650)
+        # restore the last window geometry so startup does not resize/relayout twice
+        self._settings = QtCore.QSettings('pyvideo', 'player')
+        geometry = self._settings.value('geometry')
+        if not geometry or not self.restoreGeometry(geometry):
+            self.resize(1000, 650)
         # Ensure window can receive keyboard events
         self.setFocusPolicy(QtCore.Qt.StrongFocus)
         self.setFocus()
 
+        # on-disk cache for folder scans
+        try:
+            self.media_cache = MediaCache(os.path.join(_cache_dir(), 'cache.sqlite'))
+        except Exception as e:
+            print(f"Cache disabled: {e}")
+            self.media_cache = None
+
         # VLC
-        self.instance = vlc.Instance("--avcodec-hw=none")
+        self.instance = vlc.Instance(_vlc_instance_args())
         self.player = self.instance.media_player_new()
 
         # video frame (native widget to host libVLC output)
@@ -386,6 +1068,12 @@ class PlayerWindow(QtWidgets.QWidget):
         self.video_frame.setMouseTracking(True)
         # Allow keyboard events to pass through to parent
         self.video_frame.setFocusPolicy(QtCore.Qt.NoFocus)
+        # native handle currently bound to the player (see _bind_video_output)
+        self._bound_win_id = None
+
+        # file dialogs, created lazily on first use
+        self._file_dialog = None
+        self._folder_dialog = None
 
         # controls on bottom (basic)
         self.open_btn = QtWidgets.QPushButton('Open File(s)')
@@ -464,12 +1152,6 @@ class PlayerWindow(QtWidgets.QWidget):
         # Allow keyboard events to pass through to parent
         self.qml_widget.setFocusPolicy(QtCore.Qt.NoFocus)
 
-        # if QML isn't ready immediately, listen for status changes to flush playlist
-        try:
-            self.qml_widget.statusChanged.connect(self._on_qml_status_changed)
-        except Exception:
-            pass
-
         # layout
         hbox = QtWidgets.QHBoxLayout()
         hbox.addLayout(left_vbox, 4)
@@ -477,152 +1159,300 @@ class PlayerWindow(QtWidgets.QWidget):
         self.setLayout(hbox)
 
         # backend bridge
-        self.backend = Backend(self.instance, self.player, self.qml_widget, self.video_frame, self)
+        self.backend = Backend(self.instance, self.player, self.qml_widget, self.video_frame, self,
+                               media_cache=self.media_cache)
         self.qml_widget.engine().rootContext().setContextProperty('pyBackend', self.backend)
 
-    def _on_qml_status_changed(self, status):
+        # status is pushed by libVLC time/length/volume events (throttled); the timer
+        # is only a slow heartbeat while playing and is stopped whenever playback is
+        # paused or stopped, so an idle player has no periodic wakeups at all
+        self._status_pending = False
+        # time/length carried by the latest libVLC events (None until one arrives
+        # for the current media): update_status uses them instead of calling
+        # get_time()/get_length() into the player on the Qt thread
+        self._ev_time = None
+        self._ev_length = None
+        # PositionChanged's 0..1 fraction, used for the slider directly
+        self._ev_position = None
+        # set by MediaPlayerStopped: after the one push that resets the bar to
+        # zero, update_status has nothing to show until playback starts again
+        self._stopped = False
+        self._stopped_shown = False
+        # last playing state from the libVLC state events: the control bar only
+        # auto-hides while playback is not running
+        self._playing = False
+        # last (pos, length, vol) pushed; an idle heartbeat with nothing new is a no-op
+        self._last_status = None
+        self._status_root = None
+        self._qml_controls = False
         try:
-            # QQuickWidget.Ready enum indicates QML root is available
-            if status == QQuickWidget.Ready:
-                root = self.qml_widget.rootObject()
-                if root and hasattr(self, 'backend'):
-                    # flush existing playlist entries into QML
-                    try:
-                        for idx, p in enumerate(self.backend.playlist):
-                            try:
-                                root.addItem(os.path.basename(p), p, 0, 0)
-                            except Exception:
-                                pass
-                    except Exception:
-                        pass
+            self.vlc_events = self.player.event_manager()
+            for ev in (vlc.EventType.MediaPlayerTimeChanged, vlc.EventType.MediaPlayerLengthChanged,
+                       vlc.EventType.MediaPlayerPositionChanged, vlc.EventType.MediaPlayerAudioVolume):
+                self.vlc_events.event_attach(ev, self._vlc_status_callback)
+            # end of media and playback errors also leave the player not playing:
+            # without them _playing (auto-hide) and the heartbeat would keep
+            # treating a finished or failed file as running. This is a separate
+            # event manager wrapper, so Backend's own EndReached handler stays attached
+            for ev in (vlc.EventType.MediaPlayerPlaying, vlc.EventType.MediaPlayerPaused,
+                       vlc.EventType.MediaPlayerStopped, vlc.EventType.MediaPlayerEndReached,
+                       vlc.EventType.MediaPlayerEncounteredError):
+                self.vlc_events.event_attach(ev, self._vlc_state_callback)
         except Exception:
-            pass
-
-        # timer for status
+            self.vlc_events = None
         self.timer = QtCore.QTimer(self)
-        self.timer.setInterval(500)
+        self.timer.setInterval(self.STATUS_HEARTBEAT_MS)
         self.timer.timeout.connect(self.update_status)
-        self.timer.start()
+        if self.vlc_events is None:
+            # no events to drive it: keep polling
+            self.timer.start()
 
         # note: keyboard shortcuts handled in eventFilter to avoid QShortcut import issues
 
+        # keyboard shortcuts: one dict lookup per key press instead of an if-chain
+        self._key_handlers = {
+            QtCore.Qt.Key_Return: self.toggle_fullscreen,
+            QtCore.Qt.Key_Enter: self.toggle_fullscreen,
+            QtCore.Qt.Key_Space: self.toggle_play,
+            QtCore.Qt.Key_Left: lambda: self.seek(-self.SEEK_MS),
+            QtCore.Qt.Key_Right: lambda: self.seek(self.SEEK_MS),
+            QtCore.Qt.Key_Up: lambda: self.change_volume(self.VOL_STEP),
+            QtCore.Qt.Key_Down: lambda: self.change_volume(-self.VOL_STEP),
+        }
+
+        # pending relative seek, flushed by a short single-shot timer
+        self._seek_accum = 0
+        self._seek_timer = QtCore.QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(40)
+        self._seek_timer.timeout.connect(self._flush_seek)
+
+        # slider scrubbing: sliderMoved fires per pixel, so only the latest drag
+        # position is sent to libVLC once the pointer pauses (or on release)
+        self._scrub_percent = None
+        self._scrub_timer = QtCore.QTimer(self)
+        self._scrub_timer.setSingleShot(True)
+        self._scrub_timer.setInterval(80)
+        self._scrub_timer.timeout.connect(self._flush_scrub)
+
+        # formatted time-label parts, recomputed only when their value changes
+        self._length_ms = -1
+        self._length_str = '--:--'
+        self._pos_s = -1
+        self._pos_str = '00:00'
+        # values last written to the control bar: update_status compares against
+        # these instead of reading the widgets back between its writes
+        self._time_text = self.time_label.text()
+        self._vol_shown = self.vol_slider.value()
+        self._slider_val = self.pos_slider.value()
+
         # track user interaction with slider
         self._user_dragging = False
         # remember playlist visibility when entering fullscreen
         self._pre_fs_playlist_visible = True
 
-        # install global event filter to detect mouse movement for auto-hide
-        QtWidgets.QApplication.instance().installEventFilter(self)
+        # event filter for mouse movement (auto-hide) and shortcuts on the widgets
+        # that can hold the pointer or focus; an app-wide filter would see every event
+        for w in (self, self.video_frame, self.qml_widget, self.control_bar):
+            w.installEventFilter(self)
+            w.setMouseTracking(True)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._bind_video_output()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QtCore.QEvent.WindowStateChange and not self.isMinimized():
+            self.update_status()
 
-    def _seek_relative(self, ms):
+    def _bind_video_output(self):
+        # hand libVLC the native handle of the video frame; realising winId() can
+        # round-trip to the windowing system, so only rebind when it changed
         try:
-            # Check if player has media loaded
-            if not self.player.get_media():
+            win_id = int(self.video_frame.winId())
+            if win_id == self._bound_win_id:
                 return
-            t = self.player.get_time()
-            if t is None or t < 0:
-                t = 0
-            length = self.player.get_length()
-            if length is None or length < 0:
-                length = 0
-            new_time = max(0, int(t + ms))
-            if length > 0:
-                new_time = min(new_time, length - 100)
-            self.player.set_time(new_time)
+            # set video output window (Windows / Linux / macOS handled by instance)
+            if sys.platform.startswith('win'):
+                self.player.set_hwnd(win_id)
+            elif sys.platform.startswith('linux'):
+                self.player.set_xwindow(win_id)
+            elif sys.platform.startswith('darwin'):
+                self.player.set_nsobject(win_id)
+            self._bound_win_id = win_id
         except Exception as e:
-            print(f"Seek error: {e}")
+            print(f"Error binding video output: {e}")
+
+    def closeEvent(self, event):
+        # keep the windowed geometry; a fullscreen session should not start fullscreen
+        if not self.isFullScreen():
+            self._settings.setValue('geometry', self.saveGeometry())
+        self.backend.shutdown()
+        super().closeEvent(event)
 
-    def _change_volume(self, delta):
+    def _vlc_status_callback(self, event):
+        # runs on a libVLC thread: keep the event's payload (plain attribute stores),
+        # then post to the Qt thread at most once per throttle window
+        et = event.type
+        if et == vlc.EventType.MediaPlayerTimeChanged:
+            self._ev_time = event.u.new_time
+        elif et == vlc.EventType.MediaPlayerPositionChanged:
+            self._ev_position = event.u.new_position
+        elif et == vlc.EventType.MediaPlayerLengthChanged:
+            self._ev_length = event.u.new_length
+        if self._status_pending:
+            return
+        self._status_pending = True
         try:
-            v = self.player.audio_get_volume()
-            if v is None or v < 0:
-                v = 100
-            v = max(0, min(100, int(v + delta)))
-            self.player.audio_set_volume(v)
-            # Update UI immediately
-            try:
-                if hasattr(self, 'vol_slider'):
-                    self.vol_slider.setValue(v)
-                if hasattr(self, 'vol_label'):
-                    self.vol_label.setText(f'Vol: {v}')
-            except Exception:
-                pass
-        except Exception as e:
-            print(f"Volume change error in eventFilter: {e}")
+            QtCore.QMetaObject.invokeMethod(self, '_on_vlc_status', QtCore.Qt.QueuedConnection)
+        except Exception:
+            self._status_pending = False
 
-    def eventFilter(self, obj, event):
-        # show controls on mouse move
+    @Slot()
+    def _on_vlc_status(self):
+        self.update_status()
+        QtCore.QTimer.singleShot(self.STATUS_THROTTLE_MS, self._clear_status_pending)
+
+    def _clear_status_pending(self):
+        self._status_pending = False
+
+    def _vlc_state_callback(self, event):
+        # libVLC thread: hand the new playing state to the Qt thread
+        stopped = event.type == vlc.EventType.MediaPlayerStopped
+        if stopped:
+            # the next media reports its own time/length; read live until it does
+            self._ev_time = self._ev_length = self._ev_position = None
+        self._stopped_shown = False
+        self._stopped = stopped
         try:
-            if event.type() == QtCore.QEvent.MouseMove:
-                try:
-                    self.control_bar.setVisible(True)
-                    self.hide_timer.start()
-                except Exception:
-                    pass
-            # When video frame is clicked, give focus to main window for keyboard input
-            if event.type() == QtCore.QEvent.MouseButtonPress:
-                if obj == self.video_frame:
-                    self.setFocus()
-                    return False  # Let the event continue
-            # keyboard shortcuts - handle globally for this window and its children
-            if event.type() == QtCore.QEvent.KeyPress:
-                # Process keyboard events for this window and its child widgets
-                if obj == self or obj == self.video_frame or obj == self.qml_widget or obj == self.control_bar or hasattr(obj, 'parent') and obj.parent() == self:
-                    key = event.key()
-                    if key == QtCore.Qt.Key_Space:
-                        self.toggle_play()
-                        event.accept()
-                        return True
-                    if key in (QtCore.Qt.Key_Enter, QtCore.Qt.Key_Return):
-                        # toggle fullscreen via centralized handler
-                        try:
-                            self.toggle_fullscreen()
-                        except Exception:
-                            pass
-                        event.accept()
-                        return True
-                    if key == QtCore.Qt.Key_Left:
-                        self._seek_relative(-self.SEEK_MS)
-                        event.accept()
-                        return True
-                    if key == QtCore.Qt.Key_Right:
-                        self._seek_relative(self.SEEK_MS)
-                        event.accept()
-                        return True
-                    if key == QtCore.Qt.Key_Up:
-                        self._change_volume(self.VOL_STEP)
-                        event.accept()
-                        return True
-                    if key == QtCore.Qt.Key_Down:
-                        self._change_volume(-self.VOL_STEP)
-                        event.accept()
-                        return True
+            QtCore.QMetaObject.invokeMethod(self, '_on_vlc_state', QtCore.Qt.QueuedConnection,
+                                             QtCore.Q_ARG(bool, event.type == vlc.EventType.MediaPlayerPlaying))
         except Exception:
             pass
+
+    @Slot(bool)
+    def _on_vlc_state(self, playing):
+        # controls stay visible during playback (as update_status used to force);
+        # pausing/stopping arms the auto-hide
+        self._playing = playing
+        if playing:
+            self.timer.start()
+            self.hide_timer.stop()
+            self.control_bar.setVisible(True)
+        else:
+            self.timer.stop()
+            self.hide_timer.start()
+        # one final push so the paused/stopped position is shown
+        self.update_status()
+
+    def eventFilter(self, obj, event):
+        # installed only on the window and the widgets that host the video,
+        # playlist and controls, so this runs for their events alone
+        et = event.type()
+        if et == QtCore.QEvent.MouseMove:
+            # show controls on mouse move; they only auto-hide when not playing
+            self.control_bar.setVisible(True)
+            if not self._playing:
+                self.hide_timer.start()
+        elif et == QtCore.QEvent.MouseButtonPress:
+            # When video frame is clicked, give focus to main window for keyboard input
+            if obj is self.video_frame:
+                self.setFocus()
+        elif et == QtCore.QEvent.KeyPress:
+            if self._dispatch_key(event):
+                return True
         return super().eventFilter(obj, event)
 
+    def _dispatch_key(self, event):
+        # shared by eventFilter and keyPressEvent; True when a shortcut handled it
+        handler = self._key_handlers.get(event.key())
+        if handler is None:
+            return False
+        try:
+            handler()
+        except Exception as e:
+            print(f"Key handler error: {e}")
+        event.accept()
+        return True
+
     def open_files(self):
-        paths, _ = QtWidgets.QFileDialog.getOpenFileNames(self, 'Open Video Files')
+        # dialogs are created once and reused: their shell/namespace setup is paid
+        # on first use only and they reopen in the last visited directory
+        if self._file_dialog is None:
+            self._file_dialog = QtWidgets.QFileDialog(self, 'Open Video Files')
+            self._file_dialog.setFileMode(QtWidgets.QFileDialog.ExistingFiles)
+            # offer exactly what addFiles accepts; anything picked via
+            # "All files" that it turns away is reported by its toast
+            self._file_dialog.setNameFilters([
+                'Video files (%s)' % ' '.join('*' + e for e in sorted(_VIDEO_EXTS)),
+                'All files (*)'])
+        if not self._file_dialog.exec():
+            return
+        paths = self._file_dialog.selectedFiles()
         if paths:
             self.backend.addFiles(paths)
-            # play first
+            # play the first file that was actually added
             if not self.player.is_playing():
-                self.backend.playAt(len(self.backend.playlist) - len(paths))
+                for p in paths:
+                    index = self.backend.index_of(p)
+                    if index >= 0:
+                        self.backend.playAt(index)
+                        break
 
     def open_folder(self):
-        folder = QtWidgets.QFileDialog.getExistingDirectory(self, 'Open Folder')
+        if self._folder_dialog is None:
+            self._folder_dialog = QtWidgets.QFileDialog(self, 'Open Folder')
+            self._folder_dialog.setFileMode(QtWidgets.QFileDialog.Directory)
+            self._folder_dialog.setOption(QtWidgets.QFileDialog.ShowDirsOnly, True)
+        if not self._folder_dialog.exec():
+            return
+        selected = self._folder_dialog.selectedFiles()
+        folder = selected[0] if selected else ''
         if not folder:
             return
-        exts = ('.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm')
-        files = []
-        for root, _, files_in_dir in os.walk(folder):
-            for fn in sorted(files_in_dir):
-                if fn.lower().endswith(exts):
-                    files.append(os.path.join(root, fn))
+        # scan in the background; the Qt thread stays responsive on large or network trees
+        self._start_folder_scan([folder])
+
+    def _start_folder_scan(self, folders, check_dirs=False):
+        # one pyvid-folder thread per request, walking its folders one after
+        # another: a drop of many folders must not start that many scandir walks
+        threading.Thread(target=self._scan_folder_worker, args=(folders, check_dirs),
+                         name='pyvid-folder', daemon=True).start()
+
+    def _scan_folder_worker(self, folders, check_dirs=False):
+        for folder in folders:
+            # check_dirs: arbitrary dropped paths; the isdir stat runs here, off the
+            # Qt thread, so a drop of many non-video files costs the GUI nothing
+            if check_dirs and not os.path.isdir(folder):
+                continue
+            try:
+                # a cache hit has no sizes; the metadata probe fills them in
+                sizes = []
+                files = self.media_cache.get_folder(folder) if self.media_cache else None
+                if files is None:
+                    files, dirs, sizes = _scan_videos(folder)
+                    if self.media_cache:
+                        self.media_cache.put_folder(folder, dirs, files)
+            except Exception as e:
+                print(f"Folder scan error: {e}")
+                continue
+            # posted per folder, so the first folder plays without waiting for the rest
+            try:
+                QtCore.QMetaObject.invokeMethod(self, '_on_folder_scanned', QtCore.Qt.QueuedConnection,
+                                                 QtCore.Q_ARG('QStringList', files),
+                                                 QtCore.Q_ARG('QVariantList', sizes))
+            except Exception:
+                pass
+
+    @Slot('QStringList', 'QVariantList')
+    def _on_folder_scanned(self, files, sizes):
         if files:
-            self.backend.addFiles(files)
+            # scandir (or a cache entry validated against directory mtimes) already
+            # proved these exist
+            self.backend.addFiles(files, verified=True, sizes=sizes or None)
             if not self.player.is_playing():
-                self.backend.playAt(len(self.backend.playlist) - len(files))
+                self.backend.playAt(self.backend.index_of(files[0]))
 
     def toggle_fullscreen(self):
         # Toggle fullscreen and manage playlist/control visibility
@@ -633,6 +1463,7 @@ class PlayerWindow(QtWidgets.QWidget):
             
             # enter fullscreen
             self.showFullScreen()
+            self._bind_video_output()
             # Tell libVLC to use fullscreen mode and reset scaling so it fills the window
             self.player.set_fullscreen(True)
             if hasattr(self.player, 'video_set_scale'):
@@ -641,6 +1472,7 @@ class PlayerWindow(QtWidgets.QWidget):
             # exiting fullscreen: show playlist and controls
             self.player.set_fullscreen(False)
             self.showNormal()
+            self._bind_video_output()
             self.qml_widget.setVisible(True)
             self.control_bar.setVisible(True)
 
@@ -649,8 +1481,11 @@ class PlayerWindow(QtWidgets.QWidget):
         self._user_dragging = True
 
     def _pos_released(self):
+        # the release position supersedes any scrub still waiting on the timer
+        self._scrub_timer.stop()
+        self._scrub_percent = None
         try:
-            val = self.pos_slider.value()
+            val = self._slider_val = self.pos_slider.value()
             percent = (val / 1000.0) * 100.0
             self.backend.setPositionPercent(percent)
         except Exception:
@@ -658,19 +1493,31 @@ class PlayerWindow(QtWidgets.QWidget):
         finally:
             self._user_dragging = False
 
+    def _flush_scrub(self):
+        percent, self._scrub_percent = self._scrub_percent, None
+        if percent is not None:
+            self.backend.setPositionPercent(percent)
+
     def _pos_moved(self, val):
-        # live update while dragging
+        # live update while dragging: the label follows every move, the seek is debounced
         try:
-            percent = (val / 1000.0) * 100.0
-            self.backend.setPositionPercent(percent)
-            # update time label preview based on backend length if available
-            length = self.player.get_length() or 0
-            pos_ms = int((percent/100.0) * length) if length>0 else 0
-            self.time_label.setText(self._fmt_ms(pos_ms) + ' / ' + self._fmt_ms(length))
+            self._scrub_percent = (val / 1000.0) * 100.0
+            self._scrub_timer.start()
+            # update time label preview from the length update_status already
+            # formatted; libVLC is only asked before the first status push
+            length = self._length_ms
+            if length > 0:
+                length_str = self._length_str
+            else:
+                length = self.player.get_length() or 0
+                length_str = self._fmt_ms(length)
+            pos_ms = val * length // 1000 if length > 0 else 0
+            self.time_label.setText(self._fmt_ms(pos_ms) + ' / ' + length_str)
         except Exception:
             pass
 
     def _vol_changed(self, val):
+        self._vol_shown = val
         try:
             self.vol_label.setText(f'Vol: {val}')
             self.backend.setVolumePercent(float(val))
@@ -681,235 +1528,177 @@ class PlayerWindow(QtWidgets.QWidget):
         # Handle None, negative, or invalid values
         if ms is None or ms < 0:
             ms = 0
-        s = int(ms/1000)
-        h = s // 3600
-        m = (s % 3600) // 60
-        s = s % 60
-        if h:
-            return f"{h:02d}:{m:02d}:{s:02d}"
-        return f"{m:02d}:{s:02d}"
+        return _fmt_seconds(int(ms) // 1000)
 
     # (eventFilter implemented earlier to handle mouse and keyboard)
 
     def toggle_play(self):
+        # is_playing() is a cheap state read; pause/play run on the player worker
         if self.player.is_playing():
-            self.player.pause()
+            self.backend.set_playing(False)
             self.play_btn.setText('Play')
         else:
-            self.player.play()
+            self.backend.set_playing(True)
             self.play_btn.setText('Pause')
 
     def keyPressEvent(self, event):
-        key = event.key()
-        if key in (QtCore.Qt.Key_Return, QtCore.Qt.Key_Enter):
-            try:
-                self.toggle_fullscreen()
-            except Exception:
-                pass
-            event.accept()
-            return
-        if key == QtCore.Qt.Key_Space:
-            self.toggle_play()
-            event.accept()
-            return
-        if key == QtCore.Qt.Key_Left:
-            self.seek(-self.SEEK_MS)
-            event.accept()
-            return
-        if key == QtCore.Qt.Key_Right:
-            self.seek(self.SEEK_MS)
-            event.accept()
-            return
-        if key == QtCore.Qt.Key_Up:
-            self.change_volume(self.VOL_STEP)
-            event.accept()
-            return
-        if key == QtCore.Qt.Key_Down:
-            self.change_volume(-self.VOL_STEP)
-            event.accept()
-            return
-        super().keyPressEvent(event)
+        if not self._dispatch_key(event):
+            super().keyPressEvent(event)
 
     def seek(self, ms):
-        try:
-            # Check if player has media loaded
-            if not self.player.get_media():
-                return
-            cur = self.player.get_time()
-            if cur is None or cur < 0:
-                cur = 0
-            length = self.player.get_length()
-            if length is None or length < 0:
-                length = 0
-            new = max(0, cur + ms)
-            if length > 0:
-                new = min(new, length - 100)
-            self.player.set_time(int(new))
-        except Exception as e:
-            print(f"Seek error: {e}")
+        # key auto-repeat arrives faster than libVLC completes a seek: accumulate
+        # the offsets and apply them with one get_time/set_time round trip.
+        # Leading-edge throttle: restarting the timer on every repeat would push
+        # the flush back for as long as the key is held
+        self._seek_accum += ms
+        if not self._seek_timer.isActive():
+            self._seek_timer.start()
+
+    def _flush_seek(self):
+        ms, self._seek_accum = self._seek_accum, 0
+        if ms:
+            self.backend.seek_by(ms)
 
     def change_volume(self, delta):
+        # the slider mirrors the current volume, so no libVLC read is needed; setting
+        # it goes through _vol_changed, which queues the native call on the player worker
         try:
-            vol = self.player.audio_get_volume()
-            if vol is None or vol < 0:
-                vol = 100
-            new = max(0, min(100, int(vol + delta)))
-            self.player.audio_set_volume(new)
-            # Update UI immediately
-            try:
-                if hasattr(self, 'vol_slider'):
-                    self.vol_slider.setValue(new)
-                if hasattr(self, 'vol_label'):
-                    self.vol_label.setText(f'Vol: {new}')
-            except Exception:
-                pass
+            self.vol_slider.setValue(max(0, min(100, self.vol_slider.value() + int(delta))))
         except Exception as e:
             print(f"Volume change error: {e}")
 
     def update_status(self):
+        # nothing is visible while minimized: skip the libVLC reads, changeEvent
+        # pushes a fresh status when the window is restored
+        if self.isMinimized():
+            return
+        # stopped: position and length stay 0 until the next open, so only the
+        # first push after the transition does any work
+        if self._stopped:
+            if self._stopped_shown:
+                return
+            self._stopped_shown = True
+        # the libVLC reads are the only part that can fail (FFI into the player);
+        # everything below works on plain ints and widgets that always exist
         try:
             # Always get volume first (works even without media)
-            vol = self.player.audio_get_volume()
-            if vol is None or vol < 0:
-                vol = 0
-            
-            # Check if player is actually playing
-            is_playing = self.player.is_playing()
-            
-            # Get player state (0=NothingSpecial, 1=Opening, 2=Buffering, 3=Playing, 4=Paused, 5=Stopped, 6=Ended, 7=Error)
-            try:
-                state = self.player.get_state()
-            except Exception:
-                state = None
-            
+            vol_raw = self.player.audio_get_volume()
+
             # Try to get time information from VLC
-            # VLC get_time() and get_length() return milliseconds
-            pos_raw = self.player.get_time()
-            length_raw = self.player.get_length()
-            
+            # VLC get_time() and get_length() return milliseconds; the values
+            # delivered with TimeChanged/LengthChanged spare both calls
+            pos_raw = self._ev_time
+            if pos_raw is None:
+                pos_raw = self.player.get_time()
+            length_raw = self._ev_length
+            if length_raw is None:
+                length_raw = self.player.get_length()
+
             # If length is not available from player, try to get it from media object
             if (length_raw is None or length_raw < 0):
-                try:
-                    media = self.player.get_media()
-                    if media:
-                        # Try to get duration from media object
-                        media_length = media.get_duration()
-                        if media_length and media_length > 0:
-                            length_raw = media_length
-                except Exception:
-                    pass
+                media = self.player.get_media()
+                if media:
+                    # Try to get duration from media object
+                    media_length = media.get_duration()
+                    if media_length and media_length > 0:
+                        length_raw = media_length
+        except Exception as e:
+            print(f"Error in update_status: {e}")
+            return
 
-            # Handle None and negative values properly
-            # VLC returns -1 when time/length is not available
-            # Only use position if it's valid (>= 0) or if we're playing/paused
-            if pos_raw is not None and pos_raw >= 0:
-                pos = pos_raw
-            else:
-                pos = 0
-            
-            if length_raw is not None and length_raw >= 0:
-                length = length_raw
-            else:
-                length = 0
-            
-            # Debug output (can be removed later)
-            if not hasattr(self, '_last_debug_time'):
-                self._last_debug_time = 0
-            import time
-            current_time = time.time()
-            if current_time - self._last_debug_time > 2.0:  # Print every 2 seconds
-                print(f"Status: state={state}, is_playing={is_playing}, pos={pos}ms, length={length}ms, pos_raw={pos_raw}, length_raw={length_raw}")
-                self._last_debug_time = current_time
-
-            # push position, length, volume to QML
+        # VLC returns -1 when time/length/volume is not available: `or 0` maps None
+        # to 0 and max() clamps the -1 sentinel
+        vol = max(vol_raw or 0, 0)
+        pos = max(pos_raw or 0, 0)
+        length = max(length_raw or 0, 0)
+
+        if _DEBUG_STATUS:
+            # player state (0=NothingSpecial, 1=Opening, 2=Buffering, 3=Playing,
+            # 4=Paused, 5=Stopped, 6=Ended, 7=Error) is only read for this trace
+            print(f"Status: state={self.player.get_state()}, is_playing={self.player.is_playing()}, "
+                  f"pos={pos}ms, length={length}ms, pos_raw={pos_raw}, length_raw={length_raw}")
+
+        # quarter-second buckets: throttled TimeChanged events inside the same
+        # bucket would only redraw the same slider step and time text
+        status = (pos // 250, length, vol)
+        if status == self._last_status:
+            return
+        self._last_status = status
+
+        # push position, length, volume to QML, but only when its own transport
+        # controls are shown; otherwise it would update hidden items that mirror
+        # the widgets below. The flag is read once per QML root.
+        root = self.backend.qml_root
+        if root is not self._status_root:
+            self._status_root = root
+            self._qml_controls = bool(root and root.property('showQmlControls'))
+        if self._qml_controls:
             try:
-                root = self.qml_widget.rootObject()
-                if root:
-                    root.updateStatus(pos, length, vol)
-            except Exception as e:
+                root.updateStatus(pos, length, vol)
+            except RuntimeError as e:
+                # root torn down by a reload before its statusChanged arrived
                 print(f"Error updating QML status: {e}")
-            
-            # update bottom control bar (only when not user-dragging)
-            try:
-                if hasattr(self, 'pos_slider') and not getattr(self, '_user_dragging', False):
-                    if length > 0:
-                        if pos >= 0:
-                            val = int((pos/length) * 1000)
-                            val = max(0, min(1000, val))  # Clamp to valid range
-                        else:
-                            val = 0
-                    else:
-                        val = 0
-                    # Always update slider value to reflect current position
-                    old_slider_val = self.pos_slider.value()
-                    if old_slider_val != val:
-                        self.pos_slider.blockSignals(True)  # Prevent triggering events during update
-                        self.pos_slider.setValue(val)
-                        self.pos_slider.blockSignals(False)
-                        # Force slider update
-                        self.pos_slider.update()
-                        self.pos_slider.repaint()
-                        # Debug output (only print significant changes, every 5 seconds)
-                        if not hasattr(self, '_last_slider_val') or abs(self._last_slider_val - val) > 10:
-                            if not hasattr(self, '_last_slider_debug_time'):
-                                self._last_slider_debug_time = 0
-                            import time
-                            current_time = time.time()
-                            if current_time - self._last_slider_debug_time > 5.0:  # Print every 5 seconds
-                                print(f"Slider updated: {old_slider_val} -> {val}/1000 (pos={pos}ms, length={length}ms)")
-                                self._last_slider_debug_time = current_time
-                            self._last_slider_val = val
-                    
-                    # Always update time label - show actual values even if pos is 0
-                    # Format: current_time / total_time
-                    if length > 0:
-                        time_text = self._fmt_ms(pos) + ' / ' + self._fmt_ms(length)
-                    else:
-                        time_text = self._fmt_ms(pos) + ' / --:--'
-                    # Force update the time label
-                    if hasattr(self, 'time_label'):
-                        old_text = self.time_label.text()
-                        if old_text != time_text:
-                            self.time_label.setText(time_text)
-                            # Force repaint to ensure label is updated
-                            self.time_label.update()
-                            self.time_label.repaint()
-                            # Ensure label is visible
-                            self.time_label.setVisible(True)
-                            self.time_label.show()  # Explicitly show the widget
-                            # Debug output (only print when text actually changes, once per update)
-                            if not hasattr(self, '_last_time_text') or self._last_time_text != time_text:
-                                # Only print once when text changes
-                                print(f"Time label updated: '{old_text}' -> '{time_text}'")
-                                self._last_time_text = time_text
-                        # Always ensure label is visible, even if text didn't change
-                        if not self.time_label.isVisible():
-                            print(f"Time label was hidden! Making it visible...")
-                            self.time_label.setVisible(True)
-                            self.time_label.show()
-                        # Also ensure control_bar is visible and restart hide timer
-                        if hasattr(self, 'control_bar'):
-                            if not self.control_bar.isVisible():
-                                print(f"Control bar was hidden! Making it visible...")
-                                self.control_bar.setVisible(True)
-                                self.control_bar.show()
-                            # Restart the hide timer so control bar stays visible during playback
-                            if hasattr(self, 'hide_timer'):
-                                self.hide_timer.stop()
-                                # Only auto-hide if not playing (to keep controls visible during playback)
-                                if not self.player.is_playing():
-                                    self.hide_timer.start()
-                
-                # Always update volume UI
-                if hasattr(self, 'vol_slider'):
-                    vol_int = int(vol)
-                    self.vol_slider.setValue(vol_int)
-                if hasattr(self, 'vol_label'):
-                    self.vol_label.setText(f'Vol: {int(vol)}')
-            except Exception as e:
-                print(f"Error updating control bar: {e}")
-        except Exception as e:
-            print(f"Error in update_status: {e}")
+
+        # update bottom control bar (only when not user-dragging)
+        if not self._user_dragging:
+            position = self._ev_position
+            if position is not None:
+                # libVLC's own fraction: no ms division, and right even before the
+                # length is known
+                val = max(0, min(1000, int(position * 1000)))
+            elif length > 0:
+                # pos is already clamped to >= 0
+                val = min(1000, pos * 1000 // length)
+            else:
+                val = 0
+            # Always update slider value to reflect current position. Only
+            # sliderPressed/Moved/Released are connected and those fire for
+            # user drags alone, so setValue needs no signal blocking
+            old_slider_val = self._slider_val
+            if old_slider_val != val:
+                self._slider_val = val
+                self.pos_slider.setValue(val)
+                if _DEBUG_STATUS:
+                    print(f"Slider updated: {old_slider_val} -> {val}/1000 (pos={pos}ms, length={length}ms)")
+
+            # Always update time label - show actual values even if pos is 0
+            # Format: current_time / total_time
+            # length is fixed per media and pos only changes text once a second,
+            # so reuse the formatted strings until their second changes
+            if length != self._length_ms:
+                self._length_ms = length
+                self._length_str = self._fmt_ms(length) if length > 0 else '--:--'
+            pos_s = pos // 1000
+            if pos_s != self._pos_s:
+                self._pos_s = pos_s
+                self._pos_str = self._fmt_ms(pos)
+            # one f-string: a single BUILD_STRING instead of two intermediate concatenations
+            time_text = f'{self._pos_str} / {self._length_str}'
+            # Force update the time label
+            old_text = self._time_text
+            if old_text != time_text:
+                self._time_text = time_text
+                # setText schedules the repaint; Qt merges it with the
+                # slider's into one paint pass
+                self.time_label.setText(time_text)
+                if _DEBUG_STATUS:
+                    print(f"Time label updated: '{old_text}' -> '{time_text}'")
+            # time_label is never hidden on its own and control_bar visibility
+            # belongs to the mouse-move/hide_timer path (re-armed by _on_vlc_state),
+            # so neither is touched here
+
+        # Always update volume UI, unless a change is still queued for libVLC
+        # (its value would be stale) or there is no audio output to read from
+        if vol_raw is not None and vol_raw >= 0 and not self.backend.volume_pending():
+            vol_int = int(vol)
+            if vol_int != self._vol_shown:
+                self._vol_shown = vol_int
+                # signals blocked: echoing libVLC's own volume back through
+                # _vol_changed would queue a redundant audio_set_volume
+                self.vol_slider.blockSignals(True)
+                self.vol_slider.setValue(vol_int)
+                self.vol_slider.blockSignals(False)
+                self.vol_label.setText(f'Vol: {vol_int}')
 
     def dragEnterEvent(self, event: QtGui.QDragEnterEvent):
         if event.mimeData().hasUrls():
@@ -920,22 +1709,46 @@ class PlayerWindow(QtWidgets.QWidget):
     def dropEvent(self, event: QtGui.QDropEvent):
         if event.mimeData().hasUrls():
             urls = event.mimeData().urls()
-            paths = [url.toLocalFile() for url in urls]
-            exts = ('.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm')
-            video_files = [p for p in paths if os.path.isfile(p) and p.lower().endswith(exts)]
-            
+            paths = [url.toLocalFile() for url in urls if url.isLocalFile()]
+            # extension first: it is a string check. addFiles does the single stat
+            # that proves a video exists, so no isfile() here
+            video_files = [p for p in paths if _is_video_name(p)]
+
             if video_files:
                 self.backend.addFiles(video_files)
                 # Optionally, play the first dropped file if nothing is playing
                 if not self.player.is_playing():
-                    # play the first new file, which is at the end of the current playlist
-                    new_index = len(self.backend.playlist) - len(video_files)
-                    if new_index >= 0:
-                        self.backend.playAt(new_index)
+                    for p in video_files:
+                        index = self.backend.index_of(p)
+                        if index >= 0:
+                            self.backend.playAt(index)
+                            break
+            # dropped folders go through the same background scandir walk (and
+            # folder cache) as Open Folder, whatever their name. Everything addFiles
+            # did not take is handed over unchecked: the worker tells folders from
+            # files, so the drop handler itself does no filesystem work
+            leftover = [p for p in paths if not _is_video_name(p) or self.backend.index_of(p) < 0]
+            if leftover:
+                self._start_folder_scan(leftover, check_dirs=True)
 
 def main():
+    # QQuickWidget renders through OpenGL; ask for a 3.2 core context up front
+    # (must precede QApplication) so it is not left on a legacy or software context
+    fmt = QtGui.QSurfaceFormat.defaultFormat()
+    fmt.setVersion(3, 2)
+    fmt.setProfile(QtGui.QSurfaceFormat.CoreProfile)
+    QtGui.QSurfaceFormat.setDefaultFormat(fmt)
+    # one shared GL context group for QQuickWidget instead of a private one, and
+    # video_frame.winId() must not turn every sibling widget into a native window
+    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_ShareOpenGLContexts)
+    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_DontCreateNativeWidgetSiblings)
     app = QtWidgets.QApplication(sys.argv)
+    # fixes the per-user cache location (QStandardPaths) independent of the interpreter name
+    app.setApplicationName('py_video')
     w = PlayerWindow()
+    # ending the event loop without closing the window (e.g. a session logout)
+    # still releases the background pools
+    app.aboutToQuit.connect(w.backend.shutdown)
     w.show()
     sys.exit(app.exec())
 
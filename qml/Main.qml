@@ -17,24 +17,28 @@ Rectangle {
         playlistModel.append({"name": name, "path": path, "duration": duration, "size": size})
     }
 
+    // append a batch of {name, path, duration, size} objects with a single model insert
+    function addItems(items) {
+        if (items && items.length > 0) playlistModel.append(items)
+    }
+
     function removeItem(index) {
         if (index >= 0 && index < playlistModel.count) playlistModel.remove(index)
     }
 
+    // ListModel.move relocates the row in place: one rowsMoved instead of a
+    // remove + insert pair, delegates are kept and duration/size survive
+    function moveRange(from, to) {
+        if (from >= 0 && from < playlistModel.count && to >= 0 && to < playlistModel.count && from !== to)
+            playlistModel.move(from, to, 1)
+    }
+
     function moveUp(index) {
-        if (index > 0 && index < playlistModel.count) {
-            var obj = playlistModel.get(index)
-            playlistModel.remove(index)
-            playlistModel.insert(index-1, {"name": obj.name, "path": obj.path})
-        }
+        moveRange(index, index-1)
     }
 
     function moveDown(index) {
-        if (index >= 0 && index < playlistModel.count-1) {
-            var obj = playlistModel.get(index)
-            playlistModel.remove(index)
-            playlistModel.insert(index+1, {"name": obj.name, "path": obj.path})
-        }
+        moveRange(index, index+1)
     }
 
     function clearPlaylist() {
@@ -256,6 +260,17 @@ Rectangle {
         }
     }
 
+    // batch form of updateItemMetadata: rows of [index, durationMs, sizeBytes]
+    function updateItemsMetadata(rows) {
+        for (var i = 0; i < rows.length; i++) {
+            var r = rows[i]
+            if (r[0] >= 0 && r[0] < playlistModel.count) {
+                playlistModel.setProperty(r[0], "duration", r[1])
+                playlistModel.setProperty(r[0], "size", r[2])
+            }
+        }
+    }
+
     function showThumb(path) {
         if (!path) { thumbPreview.visible = false; return }
         thumbPreview.source = path